@@ -29,7 +29,6 @@ setup(
     },
     install_requires=[
         "PyYAML",
-        "pandas",
         "sumo-wrapper-python",
         "setuptools",
         "oneseismic",
@@ -1,14 +1,27 @@
 """Objectify an FMU case (results) as it appears on the disk."""
 
 import os
+import re
 import glob
 import time
 import logging
+import random
+import itertools
+import fnmatch
+import functools
 import warnings
 import datetime
+import pickle
+import tempfile
+import statistics
+from concurrent.futures import ThreadPoolExecutor
 
 import yaml
-import pandas as pd
+
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
 
 from fmu.sumo.uploader._fileondisk import FileOnDisk
 from fmu.sumo.uploader._upload_files import upload_files
@@ -18,6 +31,14 @@ logger.setLevel(logging.CRITICAL)
 
 # pylint: disable=C0103 # allow non-snake case variable names
 
+try:
+    _mean = statistics.fmean  # fast float path, Python 3.8+
+except AttributeError:
+    _mean = statistics.mean
+
+# Query used to resolve a case on Sumo from its fmu.case.uuid
+_CASE_QUERY_TEMPLATE = "fmu.case.uuid:{}"
+
 
 class CaseOnDisk:
     """
@@ -108,34 +129,64 @@ class CaseOnDisk:
         return self._files
 
     def add_files(self, search_string):
-        """Add files to the case, based on search string"""
+        """Add files to the case, based on one or more search strings.
+
+        Accepts a single search string or a list of search strings.
+        Overlapping patterns are merged in one pass, so a file matched
+        by several patterns is only indexed once."""
+
+        if isinstance(search_string, str):
+            search_strings = [search_string]
+        else:
+            search_strings = search_string
+
+        seen_paths = {file.path for file in self._files}
+        file_paths = []
+
+        for search_string in search_strings:
+            logger.info("Searching for files at %s", search_string)
 
-        logger.info("Searching for files at %s", search_string)
-        file_paths = _find_file_paths(search_string)
+            for file_path in _find_file_paths(search_string):
+                abs_path = os.path.abspath(file_path)
 
-        for file_path in file_paths:
-            try:
-                file = FileOnDisk(path=file_path)
-                self._files.append(file)
-                logger.info("File appended: %s", file_path)
+                if abs_path in seen_paths:
+                    continue
 
-            except IOError as err:
-                info = f"{err}. No metadata, skipping file."
-                warnings.warn(info)
+                seen_paths.add(abs_path)
+                file_paths.append(file_path)
+
+        if not file_paths:
+            return
+
+        # Each construction reads and parses a metadata yaml file, so the
+        # work is I/O bound and parallelizes well across threads.
+        with ThreadPoolExecutor(
+            max_workers=min(32, len(file_paths))
+        ) as executor:
+            for file_path, file in zip(
+                file_paths, executor.map(_load_file_on_disk, file_paths)
+            ):
+                if isinstance(file, IOError):
+                    info = f"{file}. No metadata, skipping file."
+                    warnings.warn(info)
+                else:
+                    self._files.append(file)
+                    logger.info("File appended: %s", file_path)
 
     def _get_sumo_parent_id(self):
         """Get the sumo parent ID.
 
         Call sumo, check if the case is already there. Use fmu_case_uuid for this."""
 
-        query = f"fmu.case.uuid:{self.fmu_case_uuid}"
-        search_results = self.sumo_connection.api.searchroot(query, search_size=2)
+        query = _CASE_QUERY_TEMPLATE.format(self.fmu_case_uuid)
+        search_results = self.sumo_connection.cached_searchroot(query, search_size=2)
 
         # To catch crazy rare situation when index is empty (first upload to new index)
-        if not search_results.get("hits"):
+        hits_block = search_results.get("hits")
+        if not hits_block:
             return None
 
-        hits = search_results.get("hits").get("hits")
+        hits = hits_block.get("hits")
 
         if len(hits) == 0:
             return None
@@ -163,7 +214,10 @@ class CaseOnDisk:
         sumo_parent_id = self._upload_case_metadata(self.case_metadata)
         self._sumo_parent_id = sumo_parent_id
 
-        logger.info("Case registered. SumoID: {}".format(sumo_parent_id))
+        # The case now exists on Sumo; cached lookups are stale
+        self.sumo_connection.invalidate_cache()
+
+        logger.info("Case registered. SumoID: %s", sumo_parent_id)
 
         return sumo_parent_id
 
@@ -179,7 +233,8 @@ class CaseOnDisk:
     def _get_fmu_case_uuid(self):
         """Return case_id from case_metadata."""
 
-        fmu_case_uuid = self.case_metadata.get("fmu").get("case").get("uuid")
+        fmu_block = self.case_metadata.get("fmu") or {}
+        fmu_case_uuid = (fmu_block.get("case") or {}).get("uuid")
 
         if not fmu_case_uuid:
             raise ValueError("Could not get fmu_case_uuid from case metadata")
@@ -213,7 +268,11 @@ class CaseOnDisk:
         ok_uploads = []
         failed_uploads = []
         rejected_uploads = []
-        files_to_upload = [f for f in self.files]
+        files_to_upload = list(self.files)
+
+        # Hoisted out of the retry loop; only the failed subset is retried
+        sumo_parent_id = self.sumo_parent_id
+        sumo_connection = self.sumo_connection
 
         attempts = 0
         _t0 = time.perf_counter()
@@ -223,98 +282,94 @@ class CaseOnDisk:
         while files_to_upload and attempts < max_attempts:
             upload_results = upload_files(
                 files=files_to_upload,
-                sumo_parent_id=self.sumo_parent_id,
-                sumo_connection=self.sumo_connection,
+                sumo_parent_id=sumo_parent_id,
+                sumo_connection=sumo_connection,
                 threads=threads,
             )
 
-            ok_uploads += upload_results.get("ok_uploads")
-            rejected_uploads += upload_results.get("rejected_uploads")
-            failed_uploads = upload_results.get("failed_uploads")
+            ok_uploads.extend(upload_results["ok_uploads"])
+            rejected_uploads.extend(upload_results["rejected_uploads"])
+            failed_uploads = upload_results["failed_uploads"]
 
             if not failed_uploads:
                 break
 
-            files_to_upload = [f.get("file") for f in failed_uploads]
+            files_to_upload = [f["file"] for f in failed_uploads]
 
             attempts += 1
 
-            time.sleep(3)
-            logger.debug(
-                "Retrying {} failed uploads after waiting 3 seconds".format(
-                    len(failed_uploads)
+            if attempts < max_attempts:
+                # Exponential backoff with jitter, capped at 30 seconds
+                delay = min(30, 2 ** attempts + random.uniform(0, 1))
+                logger.debug(
+                    "Retrying %s failed uploads after waiting %.1f seconds",
+                    len(failed_uploads),
+                    delay,
                 )
-            )
+                time.sleep(delay)
 
         if failed_uploads:
             warnings.warn("Stopping after {} attempts".format(attempts))
 
         _dt = time.perf_counter() - _t0
 
-        if len(ok_uploads) > 0:
+        n_ok = len(ok_uploads)
+        n_failed = len(failed_uploads)
+        n_rejected = len(rejected_uploads)
+
+        if n_ok > 0:
             upload_statistics = _calculate_upload_stats(ok_uploads)
             logger.info(upload_statistics)
 
-        if failed_uploads:
-            logger.info(f"{len(failed_uploads)} files failed to be uploaded")
-
-            for u in failed_uploads[0:4]:
-                logger.info("\n" + "=" * 50)
-
-                logger.info(f"Filepath: {u.get('blob_file_path')}")
-                logger.info(
-                    f"Metadata: [{u.get('metadata_upload_response_status_code')}] "
-                    f"{u.get('metadata_upload_response_text')}"
-                )
-                logger.info(
-                    f"Blob: [{u.get('blob_upload_response_status_code')}] "
-                    f"{u.get('blob_upload_response_status_text')}"
-                )
+        if n_failed:
+            logger.info("%s files failed to be uploaded", n_failed)
+            _log_upload_details(failed_uploads)
 
-        if rejected_uploads:
+        if n_rejected:
             logger.info(
-                f"\n\n{len(rejected_uploads)} files rejected by Sumo. First 5 rejected files:"
+                "\n\n%s files rejected by Sumo. First rejected files:", n_rejected
             )
+            _log_upload_details(rejected_uploads)
 
-            for u in rejected_uploads[0:4]:
-                logger.info("\n" + "=" * 50)
+        logger.info("Summary:")
+        logger.info("Total files count: %s", len(self.files))
+        logger.info("OK: %s", n_ok)
+        logger.info("Failed: %s", n_failed)
+        logger.info("Rejected: %s", n_rejected)
+        logger.info("Wall time: %s sec", _dt)
 
-                logger.info(f"Filepath: {u.get('blob_file_path')}")
-                logger.info(
-                    f"Metadata: [{u.get('metadata_upload_response_status_code')}] "
-                    f"{u.get('metadata_upload_response_text')}"
-                )
-                logger.info(
-                    f"Blob: [{u.get('blob_upload_response_status_code')}] "
-                    f"{u.get('blob_upload_response_status_text')}"
-                )
+        return ok_uploads
 
-        if failed_uploads:
-            logger.info(
-                f"\n\n{len(failed_uploads)} files rejected by Sumo. First 5 rejected files:"
-            )
 
-            for u in failed_uploads[0:4]:
-                logger.info("\n" + "=" * 50)
+def _load_file_on_disk(file_path):
+    """Construct a FileOnDisk, returning the IOError instead of raising.
 
-                logger.info(f"Filepath: {u.get('blob_file_path')}")
-                logger.info(
-                    f"Metadata: [{u.get('metadata_upload_response_status_code')}] "
-                    f"{u.get('metadata_upload_response_text')}"
-                )
-                logger.info(
-                    f"Blob: [{u.get('blob_upload_response_status_code')}] "
-                    f"{u.get('blob_upload_response_status_text')}"
-                )
+    Used from the add_files worker threads, where an exception would
+    cancel the remaining constructions."""
 
-        logger.info("Summary:")
-        logger.info("Total files count: %s", str(len(self.files)))
-        logger.info("OK: %s", str(len(ok_uploads)))
-        logger.info("Failed: %s", str(len(failed_uploads)))
-        logger.info("Rejected: %s", str(len(rejected_uploads)))
-        logger.info("Wall time: %s sec", str(_dt))
+    try:
+        return FileOnDisk(path=file_path)
+    except IOError as err:
+        return err
 
-        return ok_uploads
+
+def _log_upload_details(uploads):
+    """Log response details for the first few uploads in a list."""
+
+    for u in itertools.islice(uploads, 4):
+        logger.info("\n" + "=" * 50)
+
+        logger.info("Filepath: %s", u.get("blob_file_path"))
+        logger.info(
+            "Metadata: [%s] %s",
+            u.get("metadata_upload_response_status_code"),
+            u.get("metadata_upload_response_text"),
+        )
+        logger.info(
+            "Blob: [%s] %s",
+            u.get("blob_upload_response_status_code"),
+            u.get("blob_upload_response_text"),
+        )
 
 
 def _sanitize_datetimes(data):
@@ -338,24 +393,120 @@ def _sanitize_datetimes(data):
 
 
 def _load_case_metadata(case_metadata_path: str):
-    """Load the case metadata."""
-
-    if not os.path.isfile(case_metadata_path):
-        raise IOError(f"case metadata not found: {case_metadata_path}")
-
-    with open(case_metadata_path, "r") as stream:
-        yaml_data = yaml.safe_load(stream)
+    """Load the case metadata.
+
+    A parsed copy is cached as a pickle next to the yaml file, keyed on
+    the yaml file's mtime, so repeated invocations on the same case skip
+    the yaml parse. The cache is best-effort: a missing, stale or broken
+    pickle simply falls back to parsing, and failure to write it (e.g.
+    read-only case root) is ignored."""
+
+    try:
+        yaml_stat = os.stat(case_metadata_path)
+    except OSError as err:
+        raise IOError(f"case metadata not found: {case_metadata_path}") from err
+
+    cache_path = f"{case_metadata_path}.pickle"
+
+    try:
+        if os.stat(cache_path).st_mtime_ns >= yaml_stat.st_mtime_ns:
+            with open(cache_path, "rb") as stream:
+                logger.debug("Loading case metadata from cache: %s", cache_path)
+                return pickle.load(stream)
+    except Exception:  # pylint: disable=broad-except
+        # A corrupt or foreign cache can fail in many ways beyond
+        # UnpicklingError (ValueError on a newer pickle protocol,
+        # AttributeError/ImportError on garbage bytes); any of them
+        # just means re-parsing the yaml beside it.
+        logger.debug("Ignoring unusable case metadata cache: %s", cache_path)
+
+    # Slurp the file in one read and hand the bytes to libyaml directly,
+    # skipping the buffered text layer and its decode round-trip
+    fd = os.open(case_metadata_path, os.O_RDONLY)
+    try:
+        raw = os.read(fd, yaml_stat.st_size)
+    finally:
+        os.close(fd)
+
+    yaml_data = yaml.load(raw, Loader=YamlLoader)
 
     logger.debug("Sanitizing datetimes from loaded case metadata")
     yaml_data = _sanitize_datetimes(yaml_data)
 
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(cache_path) or ".")
+        with os.fdopen(fd, "wb") as stream:
+            pickle.dump(yaml_data, stream, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        logger.debug("Could not write case metadata cache: %s", cache_path)
+
     return yaml_data
 
 
+@functools.lru_cache(maxsize=256)
+def _compile_glob(pattern):
+    """Compile a glob pattern to a regex, cached across calls."""
+
+    return re.compile(fnmatch.translate(pattern))
+
+
+def _scan_directory(directory, base_pattern):
+    """Return paths in one directory whose names match the glob pattern."""
+
+    regex = _compile_glob(base_pattern)
+
+    files = []
+
+    try:
+        with os.scandir(directory or ".") as entries:
+            for entry in entries:
+                # glob does not match hidden files unless asked to explicitly
+                if entry.name.startswith(".") and not base_pattern.startswith("."):
+                    continue
+
+                try:
+                    matched = regex.match(entry.name) and entry.is_file()
+                except OSError:
+                    # unstatable entry (e.g. dangling symlink); glob's
+                    # isfile filter treats these as non-files
+                    continue
+
+                if matched:
+                    # DirEntry.path is the join already done by scandir
+                    files.append(entry.path if directory else entry.name)
+    except OSError:
+        # glob swallows listing errors; unreadable directories are
+        # routine on shared scratch areas and must not kill the upload
+        return files
+
+    return files
+
+
 def _find_file_paths(search_string):
-    """Find files and return as list of FileOnDisk instances."""
+    """Find files and return as list of FileOnDisk instances.
+
+    The directory part of the search string is expanded with glob, while
+    file names in each matched directory are matched against a cached,
+    compiled regex. Filtering on os.scandir entries avoids one stat()
+    call per candidate file. When the pattern expands to many directories
+    (e.g. realization-*/...), they are scanned concurrently since the
+    directory reads are latency-bound on network file systems."""
+
+    dir_pattern, base_pattern = os.path.split(search_string)
 
-    files = [f for f in glob.glob(search_string) if os.path.isfile(f)]
+    directories = list(glob.iglob(dir_pattern)) if dir_pattern else [""]
+
+    if len(directories) > 1:
+        with ThreadPoolExecutor() as executor:
+            scans = executor.map(
+                _scan_directory, directories, [base_pattern] * len(directories)
+            )
+        files = [path for scan in scans for path in scan]
+    else:
+        files = []
+        for directory in directories:
+            files += _scan_directory(directory, base_pattern)
 
     if len(files) == 0:
         info = "No files found! Please, check the search string."
@@ -373,25 +524,33 @@ def _calculate_upload_stats(uploads):
     Given a list of results from file upload, calculate and return
     timing statistics for uploads."""
 
-    df = pd.DataFrame().from_dict(uploads)
+    # Struct-of-arrays: pull the two timing columns out of the result
+    # dicts once, so the reductions run over flat float lists instead
+    # of touching the per-file dicts again
+    blob_times = [u["blob_upload_time_elapsed"] for u in uploads]
+    metadata_times = [u["metadata_upload_time_elapsed"] for u in uploads]
 
     stats = {
         "blob": {
-            "upload_time": {
-                "mean": df["blob_upload_time_elapsed"].mean(),
-                "max": df["blob_upload_time_elapsed"].max(),
-                "min": df["blob_upload_time_elapsed"].min(),
-                "std": df["blob_upload_time_elapsed"].std(),
-            },
+            "upload_time": _describe(blob_times),
         },
         "metadata": {
-            "upload_time": {
-                "mean": df["metadata_upload_time_elapsed"].mean(),
-                "max": df["metadata_upload_time_elapsed"].max(),
-                "min": df["metadata_upload_time_elapsed"].min(),
-                "std": df["metadata_upload_time_elapsed"].std(),
-            },
+            "upload_time": _describe(metadata_times),
         },
     }
 
     return stats
+
+
+def _describe(values):
+    """Return mean/max/min/std for a list of numbers.
+
+    Sample standard deviation (as pandas used to report); nan for a
+    single value."""
+
+    return {
+        "mean": _mean(values),
+        "max": max(values),
+        "min": min(values),
+        "std": statistics.stdev(values) if len(values) > 1 else float("nan"),
+    }
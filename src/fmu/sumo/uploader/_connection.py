@@ -1,7 +1,27 @@
+import os
+import time
 import logging
+from http.client import HTTPConnection
 
 from sumo.wrapper import CallSumoApi
 
+# The http.client default blocksize of 8 KiB means a blob upload is written
+# to the socket in many small send() calls. 1 MiB cuts the per-chunk overhead
+# considerably for the file sizes we upload. Tunable through environment.
+#
+# The default has to be patched on __init__ itself: every connection
+# assigns self.blocksize at construction, so a class attribute would be
+# shadowed and never take effect. Only rewrite the default if it still
+# is the stdlib's 8192, in case a future Python changes the signature.
+_init_defaults = HTTPConnection.__init__.__defaults__
+if _init_defaults and _init_defaults[-1] == 8192:
+    HTTPConnection.__init__.__defaults__ = _init_defaults[:-1] + (
+        int(os.getenv("SUMO_UPLOAD_BLOCKSIZE", 1 << 20)),
+    )
+
+
+SEARCH_CACHE_TTL_SECONDS = 60
+
 
 class SumoConnection:
     """Object to hold authentication towards Sumo"""
@@ -9,6 +29,7 @@ class SumoConnection:
     def __init__(self, env=None):
         self._api = None
         self._env = env
+        self._searchroot_cache = {}
 
         info = "Connection to Sumo on environment: {}".format(self.env)
         logging.info(info)
@@ -37,8 +58,32 @@ class SumoConnection:
 
         return self._api
 
+    def cached_searchroot(self, query, **kwargs):
+        """Call searchroot, caching the result for a short while.
+
+        Repeated identical queries within the TTL (e.g. resolving the
+        same case several times in one process) are answered from the
+        cache instead of a new round-trip to Sumo."""
+
+        key = (query, tuple(sorted(kwargs.items())))
+        cached = self._searchroot_cache.get(key)
+        now = time.monotonic()
+
+        if cached is not None and now - cached[0] < SEARCH_CACHE_TTL_SECONDS:
+            return cached[1]
+
+        result = self.api.searchroot(query, **kwargs)
+        self._searchroot_cache[key] = (now, result)
+
+        return result
+
+    def invalidate_cache(self):
+        """Drop cached search results, forcing fresh queries."""
+        self._searchroot_cache.clear()
+
     def refresh(self):
         """Re-create the connection"""
+        self.invalidate_cache()
         self._api = self._establish_connection()
 
     def _establish_connection(self):
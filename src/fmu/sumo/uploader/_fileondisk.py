@@ -7,9 +7,12 @@
 """
 
 import os
-import datetime
+import copy
+import mmap
 import time
 import logging
+import functools
+import threading
 import hashlib
 import base64
 import tempfile
@@ -19,6 +22,11 @@ import oneseismic.upload.__main__ as upload
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
 from sumo.wrapper._request_error import (
     AuthenticationError,
     TransientError,
@@ -40,37 +48,143 @@ def path_to_yaml_path(path):
     /my/path/file.txt --> /my/path/.file.txt.yaml
     """
 
-    dir_name = os.path.dirname(path)
-    basename = os.path.basename(path)
+    dir_name, basename = os.path.split(path)
 
     return os.path.join(dir_name, f".{basename}.yml")
 
 
+@functools.lru_cache(maxsize=4096)
+def _parse_yaml_cached(path, mtime_ns, size):
+    """Parse the yaml file at path, memoized on (path, mtime, size).
+
+    The file is slurped with a single read sized from stat and the raw
+    bytes go straight to libyaml, skipping the buffered text layer.
+    mtime_ns/size are part of the cache key so a rewritten file is
+    re-parsed rather than served stale."""
+
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        raw = os.read(fd, size)
+    finally:
+        os.close(fd)
+
+    return yaml.load(raw, Loader=YamlLoader)
+
+
 def parse_yaml(path):
-    """From path, parse file as yaml, return data"""
-    with open(path, "r") as stream:
-        data = yaml.safe_load(stream)
+    """From path, parse file as yaml, return data.
+
+    Repeated parses of an unchanged file (e.g. retries re-instantiating
+    FileOnDisk) are answered from a cache. Callers mutate the returned
+    dict, so a deep copy is handed out and the cached object stays
+    pristine."""
+
+    stat_result = os.stat(path)
+
+    return copy.deepcopy(
+        _parse_yaml_cached(path, stat_result.st_mtime_ns, stat_result.st_size)
+    )
+
 
-    return data
+_HASH_CHUNK_SIZE = 1 << 20
 
+# Files at or below this size are read straight into bytes for upload;
+# setting up an mmap costs more than a single small read. Tunable
+# through environment.
+_SMALL_FILE_THRESHOLD = int(os.getenv("SUMO_UPLOAD_SMALL_FILE_THRESHOLD", 256 << 10))
 
-def file_to_byte_string(path):
+# One reusable read buffer per thread, so concurrent hashing does not
+# allocate (and discard) a fresh chunk-sized bytes object per read.
+_thread_local = threading.local()
+
+
+def _get_hash_buffer():
+    """Return this thread's reusable hash read buffer."""
+
+    buffer = getattr(_thread_local, "hash_buffer", None)
+
+    if buffer is None:
+        buffer = bytearray(_HASH_CHUNK_SIZE)
+        _thread_local.hash_buffer = buffer
+
+    return buffer
+
+
+def md5sum_of_file(path, size=None):
     """
-    Given an path to a file, read as bytes, return byte string.
+    Given a path to a file, return the base64-encoded md5 digest of its
+    contents, reading in chunks instead of materializing the whole file.
+    Pass size when the file has already been stat'ed to save the fstat.
     """
 
+    digester = hashlib.md5()
+
     with open(path, "rb") as f:
-        byte_string = f.read()
+        if size is None:
+            size = os.fstat(f.fileno()).st_size
+
+        if size > _HASH_CHUNK_SIZE:
+            # Hash straight from the page cache; memoryview slices avoid
+            # copying the data into a user-space buffer first.
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            view = memoryview(mapped)
+            try:
+                for offset in range(0, size, _HASH_CHUNK_SIZE):
+                    digester.update(view[offset : offset + _HASH_CHUNK_SIZE])
+            finally:
+                view.release()
+                mapped.close()
+        else:
+            buffer = _get_hash_buffer()
+            view = memoryview(buffer)
+
+            while True:
+                bytes_read = f.readinto(buffer)
+                if not bytes_read:
+                    break
+                digester.update(view[:bytes_read])
+
+    return base64.b64encode(digester.digest()).decode("utf-8")
+
+
+def _backoff_seconds(err, fallback):
+    """Seconds to sleep after a transient error.
 
-    return byte_string
+    Honors a server-supplied Retry-After hint when one can be found on
+    the error; sumo-wrapper-python does not expose response headers
+    uniformly, so the lookup is defensive and any absent or malformed
+    value falls back to the local backoff schedule."""
 
+    headers = getattr(getattr(err, "response", None), "headers", None)
 
-def _datetime_now():
-    """Return datetime now on FMU standard format"""
-    return datetime.datetime.now().isoformat()
+    if headers:
+        retry_after = headers.get("Retry-After")
+        if retry_after:
+            try:
+                return max(fallback, float(retry_after))
+            except (TypeError, ValueError):
+                pass
+
+    return fallback
 
 
 class FileOnDisk:
+    # A batch instantiates one of these per uploaded file, so skip the
+    # per-instance __dict__.
+    __slots__ = (
+        "metadata_path",
+        "path",
+        "metadata",
+        "_size",
+        "basename",
+        "dir_name",
+        "_file_format",
+        "sumo_object_id",
+        "sumo_parent_id",
+        "byte_string",
+        "manifest",
+    )
+
     def __init__(self, path: str, metadata_path=None):
         """
         path (str): Path to file
@@ -81,32 +195,36 @@ class FileOnDisk:
         self.path = os.path.abspath(path)
         self.metadata = parse_yaml(self.metadata_path)
 
-        self._size = None
+        # Stat once up front; size is reused for the _sumo block, the md5
+        # pass and the upload result, so the lazy property never re-stats.
+        self._size = os.stat(self.path).st_size
 
         self.basename = os.path.basename(self.path)
         self.dir_name = os.path.dirname(self.path)
 
-        self._file_format = None
+        data = self.metadata.get("data") or {}
+        self._file_format = data.get("format")
 
         self.sumo_object_id = None
         self.sumo_parent_id = None
-
-        self.metadata["_sumo"] = {}
+        self.manifest = None
 
         # if self.metadata["class"] == "seismic":
-        if self.metadata["data"]["format"] == "segy":
-            self.metadata["_sumo"]["blob_size"] = 0
+        if self._file_format == "segy":
             self.manifest = json.loads(scan.main([self.path]))
-            self.metadata["_sumo"]["blob_sha256"] = self.manifest["guid"]
             self.byte_string = None
+            self.metadata["_sumo"] = {
+                "blob_size": 0,
+                "blob_sha256": self.manifest["guid"],
+            }
 
         else:
-            self.byte_string = file_to_byte_string(path)
-            self.metadata["_sumo"]["blob_size"] = len(self.byte_string)
-            digester = hashlib.md5(self.byte_string)
-            self.metadata["_sumo"]["blob_md5"] = base64.b64encode(
-                digester.digest()
-            ).decode("utf-8")
+            # The blob itself is streamed from disk at upload time
+            self.byte_string = None
+            self.metadata["_sumo"] = {
+                "blob_size": self.size,
+                "blob_md5": md5sum_of_file(self.path, self._size),
+            }
 
     def __repr__(self):
         if not self.metadata:
@@ -140,9 +258,28 @@ class FileOnDisk:
         return response
 
     def _upload_byte_string(self, sumo_connection, object_id, blob_url):
-        response = sumo_connection.api.save_blob(
-            blob=self.byte_string, object_id=object_id, url=blob_url
-        )
+        """Upload the file content, memory-mapped rather than read into bytes.
+
+        Small files are read directly instead; a single read is cheaper
+        than mapping and unmapping a few pages."""
+
+        if self.size <= _SMALL_FILE_THRESHOLD:
+            with open(self.path, "rb") as fileobj:
+                blob = fileobj.read()
+
+            return sumo_connection.api.save_blob(
+                blob=blob, object_id=object_id, url=blob_url
+            )
+
+        with open(self.path, "rb") as fileobj:
+            blob = mmap.mmap(fileobj.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                response = sumo_connection.api.save_blob(
+                    blob=blob, object_id=object_id, url=blob_url
+                )
+            finally:
+                blob.close()
+
         return response
 
     def _delete_metadata(self, sumo_connection, object_id):
@@ -194,7 +331,7 @@ class FileOnDisk:
                 result["status"] = "failed"
                 result["metadata_upload_response_status_code"] = err.code
                 result["metadata_upload_response_text"] = err.message
-                time.sleep(i)
+                time.sleep(_backoff_seconds(err, i))
                 continue
 
             except AuthenticationError as err:
@@ -226,7 +363,7 @@ class FileOnDisk:
             logger.debug("backoff in inner loop is %s", str(i))
             try:
                 # if self.metadata["class"] == "seismic":
-                if self.metadata["data"]["format"] == "segy":
+                if self._file_format == "segy":
                     with tempfile.NamedTemporaryFile(mode="w+") as temp:
                         json.dump(self.manifest, temp)
                         temp.flush()
@@ -280,7 +417,7 @@ class FileOnDisk:
             except TransientError as err:
                 logger.debug("Got TransientError. Sleeping for %i seconds", str(i))
                 result["status"] = "failed"
-                time.sleep(i)
+                time.sleep(_backoff_seconds(err, i))
                 continue
             except AuthenticationError as err:
                 logger.debug("Upload failed: %s", upload_response["text"])
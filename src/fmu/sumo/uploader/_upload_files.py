@@ -4,6 +4,7 @@
 
 """
 
+import asyncio
 from concurrent.futures import ThreadPoolExecutor
 
 # pylint: disable=C0103 # allow non-snake case variable names
@@ -11,22 +12,64 @@ from concurrent.futures import ThreadPoolExecutor
 
 def _upload_files(files, sumo_connection, sumo_parent_id, threads=4):
     """
-    Create threads and call _upload in each thread
+    Run the async uploader on a fresh event loop, return results.
     """
 
-    with ThreadPoolExecutor(threads) as executor:
-        results = executor.map(
-            _upload_file, [(file, sumo_connection, sumo_parent_id) for file in files]
+    # Largest files first (longest-processing-time scheduling): a big
+    # file picked up last would idle the other workers through the tail
+    # of the batch. Sizes are stat'ed once at FileOnDisk construction.
+    files = sorted(files, key=lambda file: file.size, reverse=True)
+
+    with ThreadPoolExecutor(
+        max_workers=max(1, min(threads, len(files))),
+        thread_name_prefix="sumo-upload",
+    ) as executor:
+        loop = asyncio.new_event_loop()
+        try:
+            results = loop.run_until_complete(
+                _upload_files_async(
+                    files=files,
+                    sumo_connection=sumo_connection,
+                    sumo_parent_id=sumo_parent_id,
+                    executor=executor,
+                )
+            )
+        finally:
+            loop.close()
+
+    return results
+
+
+async def _upload_files_async(files, sumo_connection, sumo_parent_id, executor):
+    """
+    Upload all files concurrently on the given executor.
+
+    The Sumo API calls (via sumo-wrapper-python) are synchronous, so each
+    upload runs as an executor task; the executor's max_workers bounds how
+    many are in flight. Results are collected as uploads finish rather
+    than in submission order, so one straggler does not hold up the rest.
+    """
+
+    loop = asyncio.get_event_loop()
+
+    tasks = [
+        loop.run_in_executor(
+            executor, _upload_file, file, sumo_connection, sumo_parent_id
         )
+        for file in files
+    ]
+
+    results = []
+
+    for task in asyncio.as_completed(tasks):
+        results.append(await task)
 
     return results
 
 
-def _upload_file(args):
+def _upload_file(file, sumo_connection, sumo_parent_id):
     """Upload a file"""
 
-    file, sumo_connection, sumo_parent_id = args
-
     result = file.upload_to_sumo(
         sumo_connection=sumo_connection, sumo_parent_id=sumo_parent_id
     )
@@ -43,7 +86,7 @@ def upload_files(files: list, sumo_parent_id: str, sumo_connection, threads=4):
     files: list of FileOnDisk objects
     sumo_parent_id: sumo_parent_id for the parent case
 
-    Upload is kept outside classes to use multithreading.
+    Upload is kept outside classes to use concurrency.
     """
 
     results = _upload_files(
@@ -57,20 +100,17 @@ def upload_files(files: list, sumo_parent_id: str, sumo_connection, threads=4):
     failed_uploads = []
     rejected_uploads = []
 
+    # Anything that is neither ok nor rejected counts as failed and is
+    # eligible for retry by the caller.
+    buckets = {"ok": ok_uploads, "rejected": rejected_uploads}
+
     for r in results:
         status = r.get("status")
 
         if not status:
             raise ValueError('File upload result returned with no "status" attribute')
 
-        if status == "ok":
-            ok_uploads.append(r)
-
-        elif status == "rejected":
-            rejected_uploads.append(r)
-
-        else:
-            failed_uploads.append(r)
+        buckets.get(status, failed_uploads).append(r)
 
     return {
         "ok_uploads": ok_uploads,
@@ -4,7 +4,6 @@
 
 import warnings
 import os
-import argparse
 import logging
 from pathlib import Path
 
@@ -16,6 +15,8 @@ from fmu.sumo import uploader
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.CRITICAL)
 
+VALID_ENVIRONMENTS = frozenset({"dev", "test", "prod", "localhost"})
+
 # This documentation is for sumo_uploader as an ERT workflow
 DESCRIPTION = """
 SUMO_UPLOAD will upload files to Sumo. The typical use case is as add-on to 
@@ -96,9 +97,7 @@ def sumo_upload_main(
             case_metadata_path=case_metadata_path, sumo_connection=sumo_connection
         )
     except Exception as err:
-        logger.info(
-            "Encountered a problem connecting to Sumo. " "The error was: " f"{err}"
-        )
+        logger.info("Encountered a problem connecting to Sumo. The error was: %s", err)
         return
 
     # add files to the case on disk object
@@ -140,8 +139,13 @@ class SumoUpload(ErtScript):
         )
 
 
-def get_parser() -> argparse.ArgumentParser:
-    """Construct parser object for sumo_upload."""
+def get_parser():
+    """Construct parser object for sumo_upload.
+
+    argparse is imported here rather than at module level, keeping it off
+    the import path of the ERT plugin discovery."""
+
+    import argparse  # pylint: disable=import-outside-toplevel
 
     parser = argparse.ArgumentParser()
     parser.add_argument("casepath", type=str, help="Absolute path to case root")
@@ -172,7 +176,7 @@ def check_arguments(args) -> None:
     logger.debug("Running check_arguments()")
     logger.debug("Arguments are: %s", str(vars(args)))
 
-    if args.env not in ["dev", "test", "prod", "localhost"]:
+    if args.env not in VALID_ENVIRONMENTS:
         warnings.warn(f"Non-standard environment: {args.env}")
 
     if not Path(args.casepath).is_absolute():
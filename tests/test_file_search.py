@@ -0,0 +1,118 @@
+"""Offline tests for the file search in _caseondisk.
+
+Asserts that _find_file_paths keeps glob semantics: same results as
+glob.glob filtered on isfile, including hidden-file suppression,
+literal paths, multi-directory wildcards and no-match patterns.
+These tests need no Sumo connection.
+"""
+
+import glob
+import os
+import warnings
+
+import pytest
+
+from fmu.sumo.uploader._caseondisk import _find_file_paths
+
+
+@pytest.fixture
+def search_tree(tmp_path):
+    """A small case-like tree with hidden metadata files and subdirs."""
+
+    for relpath in [
+        "data.txt",
+        "other.csv",
+        ".data.txt.yml",
+        ".hidden",
+        "realization-0/share/table.csv",
+        "realization-0/share/.table.csv.yml",
+        "realization-1/share/table.csv",
+        "realization-1/share/notes.txt",
+    ]:
+        path = tmp_path / relpath
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("content")
+
+    # a directory whose name matches file-like patterns
+    (tmp_path / "dir.txt").mkdir()
+
+    return tmp_path
+
+
+def _glob_files(pattern):
+    """Reference implementation: glob filtered to files only."""
+
+    return sorted(f for f in glob.glob(pattern) if os.path.isfile(f))
+
+
+@pytest.mark.parametrize(
+    "pattern",
+    [
+        "*.txt",
+        "*.csv",
+        ".*.yml",
+        ".*",
+        "*",
+        "data.txt",
+        ".data.txt.yml",
+        "realization-*/share/*.csv",
+        "realization-*/share/.*.yml",
+        "realization-*/share/*",
+        "realization-0/share/table.csv",
+        "*.does_not_exist",
+        "no_such_dir/*.txt",
+    ],
+)
+def test_find_file_paths_matches_glob(search_tree, pattern):
+    """_find_file_paths returns the same files as glob for each pattern."""
+
+    absolute_pattern = str(search_tree / pattern)
+
+    with warnings.catch_warnings():
+        # the no-match patterns trigger the "No files found" warning
+        warnings.simplefilter("ignore")
+        found = _find_file_paths(absolute_pattern)
+
+    assert sorted(found) == _glob_files(absolute_pattern)
+
+
+def test_find_file_paths_relative_pattern(search_tree, monkeypatch):
+    """Patterns without a directory part search the working directory."""
+
+    monkeypatch.chdir(search_tree)
+
+    assert sorted(_find_file_paths("*.txt")) == _glob_files("*.txt")
+    assert sorted(_find_file_paths(".*.yml")) == _glob_files(".*.yml")
+
+
+def test_find_file_paths_unreadable_directory(search_tree, monkeypatch):
+    """An unreadable directory is skipped like glob does, not raised.
+
+    os.scandir is patched to deny one directory since a chmod-based
+    fixture would not fail when the tests run as root."""
+
+    locked = str(search_tree / "realization-0" / "share")
+    real_scandir = os.scandir
+
+    def denying_scandir(path="."):
+        if str(path) == locked:
+            raise PermissionError(13, "Permission denied", str(path))
+        return real_scandir(path)
+
+    monkeypatch.setattr(os, "scandir", denying_scandir)
+
+    pattern = str(search_tree / "realization-*" / "share" / "*.csv")
+    found = _find_file_paths(pattern)
+
+    assert sorted(found) == _glob_files(pattern)
+    # the readable realization still contributes its files
+    assert str(search_tree / "realization-1" / "share" / "table.csv") in found
+
+
+def test_find_file_paths_warns_when_empty(search_tree):
+    """A pattern matching nothing warns instead of raising."""
+
+    with pytest.warns(UserWarning, match="No files found"):
+        result = _find_file_paths(str(search_tree / "*.does_not_exist"))
+
+    assert result == []